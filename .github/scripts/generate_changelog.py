@@ -13,8 +13,8 @@ from __future__ import annotations
 
 import re
 import subprocess
-from collections import defaultdict
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Iterator
 
 from semantic_release.commit_parser.conventional import ConventionalCommitParser
@@ -31,6 +31,30 @@ METADATA_PATTERNS = [
     r'\s+GitOrigin-RevId:\s+[a-f0-9]+',
 ]
 
+# Compiled once at import so the hot per-commit paths skip the re module's
+# pattern-cache lookups entirely
+_METADATA_RE = re.compile('|'.join(f'(?:{p})' for p in METADATA_PATTERNS), re.IGNORECASE)
+_AIRBNB_RE = re.compile(r'\(AIRBNB\)', re.IGNORECASE)
+
+# Fused pattern combining metadata removal with (AIRBNB) substitution so the
+# hot parse_commit path rewrites each message in a single pass
+_CLEAN_RE = re.compile(
+    '|'.join(f'(?:{p})' for p in METADATA_PATTERNS) + r'|(?P<airbnb>\(AIRBNB\))',
+    re.IGNORECASE,
+)
+
+# ASCII record separator used between Co-authored-by trailer values. Unlike
+# '|', it cannot collide with characters in author names or emails.
+COAUTHOR_SEPARATOR = '\x1e'
+
+# ASCII unit separator between fields within a git log record. Records are
+# split at the bytes level so only the retained field slices are decoded.
+FIELD_SEPARATOR = b'\x1f'
+
+# Shared parser instance; construction is not free and the parser is stateless
+# between parse_message calls
+_PARSER = ConventionalCommitParser()
+
 # Change type definitions with sort priority and display names
 CHANGE_TYPES: dict[str, tuple[int, str]] = {
     "feat": (1, "Features"),
@@ -46,7 +70,7 @@ CHANGE_TYPES: dict[str, tuple[int, str]] = {
 }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommitInfo:
     """Raw commit information extracted from git log."""
     sha: str
@@ -56,7 +80,7 @@ class CommitInfo:
     co_authors_raw: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChangelogEntry:
     """A processed changelog entry with authorship information."""
     sha: str
@@ -68,18 +92,14 @@ class ChangelogEntry:
     is_breaking: bool
     breaking_description: str | None
     bump: LevelBump
+    # Computed once at construction; rendering accesses these repeatedly
+    formatted_authors: str = field(init=False)
+    formatted_entry: str = field(init=False)
 
-    @property
-    def formatted_authors(self) -> str:
-        """Format authors as comma-separated @usernames."""
-        if self.authors:
-            return ', '.join(self.authors)
-        return '@anonymous'
-
-    @property
-    def formatted_entry(self) -> str:
-        """Format the complete changelog entry."""
-        return f"{self.description} by {self.formatted_authors}"
+    def __post_init__(self):
+        authors = ', '.join(self.authors) if self.authors else '@anonymous'
+        object.__setattr__(self, 'formatted_authors', authors)
+        object.__setattr__(self, 'formatted_entry', f"{self.description} by {authors}")
 
 
 def extract_username_from_email(email: str) -> str | None:
@@ -95,11 +115,13 @@ def extract_username_from_email(email: str) -> str | None:
     if not email:
         return None
 
-    match = re.search(r'^([^@]+)@', email)
-    if not match:
+    # Cheapest rejection first: a single find covers both the missing-'@'
+    # and empty-username cases before any slicing
+    at = email.find('@')
+    if at <= 0:
         return None
 
-    username = match.group(1)
+    username = email[:at]
     if username in BOT_USERNAMES:
         return None
 
@@ -116,12 +138,15 @@ def extract_username_from_coauthor(author_line: str) -> str | None:
     Returns:
         Username prefixed with @ (e.g., '@email'), or None if invalid/bot
     """
-    match = re.search(r'<([^@]+)@', author_line)
-    if not match:
+    lt = author_line.find('<')
+    if lt < 0:
+        return None
+    at = author_line.find('@', lt + 1)
+    if at < 0:
         return None
 
-    username = match.group(1)
-    if username in BOT_USERNAMES:
+    username = author_line[lt + 1:at]
+    if not username or username in BOT_USERNAMES:
         return None
 
     return f"@{username}"
@@ -137,10 +162,10 @@ def clean_commit_message(message: str) -> str:
     Returns:
         Cleaned commit message with metadata removed
     """
-    cleaned = message
-    for pattern in METADATA_PATTERNS:
-        cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-    return cleaned.strip()
+    # str.split() with no arguments both strips and collapses interior runs
+    # of whitespace left behind by the removed metadata, without a second
+    # regex pass
+    return ' '.join(_METADATA_RE.sub('', message).split())
 
 
 def replace_airbnb_marker(message: str, sha: str) -> str:
@@ -154,7 +179,20 @@ def replace_airbnb_marker(message: str, sha: str) -> str:
     Returns:
         Message with (AIRBNB) replaced by (sha)
     """
-    return re.sub(r'\(AIRBNB\)', f'({sha})', message, flags=re.IGNORECASE)
+    # Fast path: almost no commits carry the marker, and a substring scan is
+    # far cheaper than running the regex engine to find nothing
+    if 'airbnb' not in message.lower():
+        return message
+    return _AIRBNB_RE.sub(f'({sha})', message)
+
+
+def _clean_message(message: str, sha: str) -> str:
+    """Apply clean_commit_message and replace_airbnb_marker in one regex pass."""
+    cleaned = _CLEAN_RE.sub(
+        lambda m: f'({sha})' if m.lastgroup == 'airbnb' else '',
+        message,
+    )
+    return ' '.join(cleaned.split())
 
 
 def should_include_commit(message: str) -> bool:
@@ -167,7 +205,9 @@ def should_include_commit(message: str) -> bool:
     Returns:
         True if commit should be included, False if it should be ignored
     """
-    return not message.lower().startswith('ignore:')
+    # Bounded slice keeps the case-insensitive prefix check O(1): only the
+    # first seven characters are ever copied and lowercased
+    return message[:7].lower() != 'ignore:'
 
 
 def get_commits_between_tags(tag1: str, tag2: str) -> Iterator[CommitInfo]:
@@ -181,56 +221,79 @@ def get_commits_between_tags(tag1: str, tag2: str) -> Iterator[CommitInfo]:
     Yields:
         CommitInfo objects for each commit in the range
     """
-    # Custom format with markers for reliable parsing
-    # Use %x00 (null byte) as record separator since body can contain newlines
+    # Unit-separated fields (%x1f) with a null byte (%x00) between records,
+    # since bodies can contain newlines. Control characters cannot appear in
+    # the fields themselves, so a plain split recovers every field.
     format_str = (
-        'SHA_START%hSHA_END '
-        'MSG_START%sMSG_END '
-        'BODY_START%bBODY_END '
-        'AUTHOR_START%aeAUTHOR_END '
-        'COAUTHORS_START%(trailers:key=Co-authored-by,valueonly,separator=%x7C)COAUTHORS_END'
+        '%h%x1f'
+        '%s%x1f'
+        '%b%x1f'
+        '%ae%x1f'
+        '%(trailers:key=Co-authored-by,valueonly,separator=%x1E)'
         '%x00'  # Null byte as record separator
     )
 
-    result = subprocess.run(
-        ['git', 'log', f'{tag1}..{tag2}', f'--format=format:{format_str}'],
-        capture_output=True,
-        text=True,
-        check=True,
+    # Stream git's output instead of buffering the whole range: yield each
+    # null-delimited record as soon as it is complete, keeping peak memory
+    # proportional to one record rather than the entire log.
+    proc = subprocess.Popen(
+        ['git', 'log', '--no-merges', f'{tag1}..{tag2}', f'--format=format:{format_str}'],
+        stdout=subprocess.PIPE,
     )
+    try:
+        for record in _iter_null_delimited(proc.stdout):
+            if not record.strip():
+                continue
+            commit = _parse_record(record)
+            # Filter ignored commits here so they never reach the cleaning,
+            # author-extraction, or PSR parsing stages downstream
+            if commit is not None and should_include_commit(commit.message):
+                yield commit
+    finally:
+        proc.stdout.close()
+        returncode = proc.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(
+                returncode, ['git', 'log', f'{tag1}..{tag2}']
+            )
+
+
+def _iter_null_delimited(stream) -> Iterator[bytes]:
+    """Yield null-delimited byte records from a binary stream."""
+    buffer = bytearray()
+    while True:
+        chunk = stream.read(65536)
+        if not chunk:
+            break
+        buffer.extend(chunk)
+        *complete, rest = buffer.split(b'\x00')
+        buffer = bytearray(rest)
+        yield from complete
+    if buffer:
+        yield bytes(buffer)
+
+
+def _parse_record(record: bytes) -> CommitInfo | None:
+    """Parse a single unit-separated git log record into a CommitInfo.
+
+    Splitting happens on the raw bytes; only the five field slices are
+    decoded, so the bulk of the log never pays UTF-8 validation.
+    """
+    fields = record.split(FIELD_SEPARATOR)
+    if len(fields) != 5:
+        return None
 
-    # Split on null byte instead of newlines to handle multi-line bodies
-    for record in result.stdout.split('\x00'):
-        if not record.strip():
-            continue
-
-        # Extract SHA
-        sha_match = re.search(r'SHA_START(.+?)SHA_END', record)
-        sha = sha_match.group(1).strip() if sha_match else ''
-
-        # Extract message
-        msg_match = re.search(r'MSG_START(.+?)MSG_END', record)
-        message = msg_match.group(1).strip() if msg_match else ''
-
-        # Extract body (use DOTALL flag since body can contain newlines)
-        body_match = re.search(r'BODY_START(.+?)BODY_END', record, re.DOTALL)
-        body = body_match.group(1).strip() if body_match else ''
-
-        # Extract author email
-        author_match = re.search(r'AUTHOR_START(.+?)AUTHOR_END', record)
-        author_email = author_match.group(1).strip() if author_match else ''
-
-        # Extract co-authors
-        coauthors_match = re.search(r'COAUTHORS_START(.*)COAUTHORS_END', record)
-        co_authors_raw = coauthors_match.group(1).strip() if coauthors_match else ''
-
-        yield CommitInfo(
-            sha=sha,
-            message=message,
-            body=body,
-            author_email=author_email,
-            co_authors_raw=co_authors_raw,
-        )
+    # With --format=format: git emits a newline between records, so every
+    # record after the first starts with '\n' in its sha field; the email and
+    # trailer fields are interior and come out without padding
+    sha, message, body, author_email, co_authors_raw = fields
+    return CommitInfo(
+        sha=sha.strip().decode('ascii', errors='replace'),
+        message=message.strip().decode('utf-8', errors='replace'),
+        body=body.strip().decode('utf-8', errors='replace'),
+        author_email=author_email.decode('utf-8', errors='replace'),
+        co_authors_raw=co_authors_raw.decode('utf-8', errors='replace'),
+    )
 
 
 def extract_authors(commit: CommitInfo) -> list[str]:
@@ -252,17 +315,19 @@ def extract_authors(commit: CommitInfo) -> list[str]:
 
     # Add co-authors
     if commit.co_authors_raw:
-        for coauthor in commit.co_authors_raw.split('|'):
-            coauthor = coauthor.strip()
-            if coauthor:
-                username = extract_username_from_coauthor(coauthor)
-                if username:
-                    authors.append(username)
+        # Single pass: split parts are filtered and mapped to usernames
+        # without materializing intermediate lists (the control-character
+        # split cannot introduce whitespace, so no per-part strip is needed)
+        authors.extend(
+            username
+            for coauthor in commit.co_authors_raw.split(COAUTHOR_SEPARATOR)
+            if coauthor and (username := extract_username_from_coauthor(coauthor))
+        )
 
     return authors
 
 
-def parse_commit(commit: CommitInfo, parser: ConventionalCommitParser) -> ChangelogEntry | None:
+def parse_commit(commit: CommitInfo, parser: ConventionalCommitParser = _PARSER) -> ChangelogEntry | None:
     """
     Parse a commit into a ChangelogEntry.
 
@@ -277,15 +342,14 @@ def parse_commit(commit: CommitInfo, parser: ConventionalCommitParser) -> Change
     if not should_include_commit(commit.message):
         return None
 
-    # Clean the message
-    cleaned_message = clean_commit_message(commit.message)
-    cleaned_message = replace_airbnb_marker(cleaned_message, commit.sha)
+    # Clean the message (metadata removal + AIRBNB substitution in one scan)
+    cleaned_message = _clean_message(commit.message, commit.sha)
 
     # Extract authors
     authors = extract_authors(commit)
 
     # Parse with conventional commit parser (don't include authors in message - they're added later)
-    message_with_body = f"{cleaned_message}\n\n{commit.body}"
+    message_with_body = f"{cleaned_message}\n\n{commit.body}" if commit.body else cleaned_message
     parsed = parser.parse_message(message_with_body)
 
     if isinstance(parsed, ParsedMessageResult):
@@ -326,58 +390,50 @@ def group_entries_by_type(entries: list[ChangelogEntry]) -> dict[str, list[Chang
     Returns:
         Dictionary mapping change types to lists of entries
     """
-    grouped: dict[str, list[ChangelogEntry]] = defaultdict(list)
+    # Pre-size buckets for the known change types; unknown types still get
+    # their own bucket and non-conventional commits go under 'chore'
+    grouped: dict[str, list[ChangelogEntry]] = {t: [] for t in CHANGE_TYPES}
     for entry in entries:
-        if entry.change_type:
-            grouped[entry.change_type].append(entry)
-        else:
-            # Non-conventional commits go under 'chore'
-            grouped['chore'].append(entry)
-    return dict(grouped)
+        key = entry.change_type or 'chore'
+        bucket = grouped.get(key)
+        if bucket is None:
+            bucket = grouped[key] = []
+        bucket.append(entry)
+    return {k: v for k, v in grouped.items() if v}
 
 
-def render_section(change_type: str, entries: list[ChangelogEntry]) -> str:
+def render_section(change_type: str, entries: list[ChangelogEntry], out: list[str]) -> None:
     """
     Render a changelog section for a specific change type.
 
     Args:
         change_type: The type of change (feat, fix, etc.)
         entries: List of entries for this type
-
-    Returns:
-        Formatted markdown section
+        out: List of output lines to append to
     """
-    if change_type not in CHANGE_TYPES:
-        title = change_type.title()
-        priority = 99
-    else:
-        priority, title = CHANGE_TYPES[change_type]
+    _, title = CHANGE_TYPES.get(change_type, (99, change_type.title()))
 
-    lines = [f"## {title}", ""]
+    out.append(f"## {title}")
+    out.append("")
     for entry in entries:
-        lines.append(f"- {entry.formatted_entry}")
-    lines.append("")
-
-    return '\n'.join(lines)
+        out.append(f"- {entry.formatted_entry}")
+    out.append("")
 
 
-def render_breaking_changes(entries: list[ChangelogEntry]) -> str:
+def render_breaking_changes(entries: list[ChangelogEntry], out: list[str]) -> None:
     """
     Render the breaking changes section.
 
     Args:
         entries: List of entries with breaking changes
-
-    Returns:
-        Formatted markdown section for breaking changes
+        out: List of output lines to append to
     """
-    lines = ["## Breaking Changes", ""]
+    out.append("## Breaking Changes")
+    out.append("")
     for entry in entries:
         desc = entry.breaking_description or entry.description
-        lines.append(f"- {desc} by {entry.formatted_authors}")
-    lines.append("")
-
-    return '\n'.join(lines)
+        out.append(f"- {desc} by {entry.formatted_authors}")
+    out.append("")
 
 
 def generate_changelog(tag1: str, tag2: str) -> str:
@@ -391,12 +447,10 @@ def generate_changelog(tag1: str, tag2: str) -> str:
     Returns:
         Formatted markdown changelog
     """
-    parser = ConventionalCommitParser()
-
     # Get and parse all commits
     entries: list[ChangelogEntry] = []
     for commit in get_commits_between_tags(tag1, tag2):
-        entry = parse_commit(commit, parser)
+        entry = parse_commit(commit)
         if entry:
             entries.append(entry)
 
@@ -410,24 +464,22 @@ def generate_changelog(tag1: str, tag2: str) -> str:
     # Group regular entries by type
     grouped = group_entries_by_type(regular_entries)
 
-    # Sort sections by priority
-    sorted_types = sorted(
-        grouped.keys(),
-        key=lambda t: CHANGE_TYPES.get(t, (99, t))[0]
-    )
+    # Sort sections by priority (one dict lookup per distinct type)
+    type_priority = {t: CHANGE_TYPES.get(t, (99, t))[0] for t in grouped}
+    sorted_types = sorted(grouped.keys(), key=type_priority.__getitem__)
 
-    # Build changelog
-    sections = [f"# Version {tag2}", ""]
+    # Build changelog as a flat list of lines, joined exactly once
+    lines = [f"# Version {tag2}", ""]
 
     # Add breaking changes first if any
     if breaking_entries:
-        sections.append(render_breaking_changes(breaking_entries))
+        render_breaking_changes(breaking_entries, lines)
 
     # Add regular sections
     for change_type in sorted_types:
-        sections.append(render_section(change_type, grouped[change_type]))
+        render_section(change_type, grouped[change_type], lines)
 
-    return '\n'.join(sections)
+    return '\n'.join(lines)
 
 
 def main():
@@ -443,7 +495,10 @@ def main():
     args = arg_parser.parse_args()
 
     changelog = generate_changelog(args.tag1, args.tag2)
-    print(changelog)
+    # Write pre-encoded bytes in one call rather than going through print's
+    # text-layer formatting and per-write flushing
+    sys.stdout.buffer.write(changelog.encode('utf-8') + b'\n')
+    sys.stdout.buffer.flush()
 
 
 if __name__ == '__main__':
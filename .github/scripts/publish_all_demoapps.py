@@ -15,34 +15,38 @@ Authentication:
 """
 
 import sys
-import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import re
 
+from demoapps_to_external_push import publish
 
-def publish_demoapp(python_script, demoapp_name, github_repo):
-    """Run the Python demoapp publisher and return success/failure."""
+# Serializes result reporting from the publish worker threads
+_print_lock = threading.Lock()
+
+# Compiled once at import
+_RELEASE_BRANCH_RE = re.compile(r"^release/v\d+\.\d+\.\d+$")
+
+
+def publish_demoapp(demoapp_name, github_repo):
+    """Run the demoapp publisher in-process and return success/failure."""
     try:
-        subprocess.run(
-            ["python3", str(python_script), demoapp_name, github_repo], check=True
-        )
-        return True
-    except subprocess.CalledProcessError:
+        return publish(demoapp_name, github_repo)
+    except Exception as e:
+        print(f"❌ {demoapp_name} publish raised: {e}")
         return False
 
 
 def verify_release_branch():
     """Verify we're on a release branch."""
+    # Read .git/HEAD directly: 'ref: refs/heads/<branch>' for a checked-out
+    # branch, a bare SHA when detached (which then fails the format check)
+    head_file = Path(__file__).resolve().parent.parent.parent / ".git" / "HEAD"
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        branch_name = result.stdout.strip()
-
-        if not re.match(r"^release/v\d+\.\d+\.\d+$", branch_name):
+        branch_name = head_file.read_text().strip().removeprefix("ref: refs/heads/")
+
+        if not _RELEASE_BRANCH_RE.match(branch_name):
             print(f"❌ This script must be run on a release branch")
             print(f"   Current branch: {branch_name}")
             print(f"   Expected format: release/v[major].[minor].[patch]")
@@ -50,15 +54,12 @@ def verify_release_branch():
 
         print(f"✅ Running on release branch: {branch_name}")
         return True
-    except subprocess.CalledProcessError as e:
+    except OSError as e:
         print(f"❌ Failed to determine current branch: {e}")
         return False
 
 
 def main():
-    script_dir = Path(__file__).parent.resolve()
-    demoapp_publisher = script_dir / "demoapps_to_external_push.py"
-
     # Verify we're on a release branch
     if not verify_release_branch():
         return 1
@@ -77,16 +78,26 @@ def main():
     # Track failures
     failed_apps = []
 
-    # Publish each demo app
-    for app_name, github_repo in demo_apps:
-        print(f">>> Publishing {app_name} demo app...")
-        if publish_demoapp(demoapp_publisher, app_name, github_repo):
-            print(f"✅ {app_name} published successfully")
-        else:
-            print(f"❌ {app_name} publish failed")
-            failed_apps.append(app_name)
+    # Publish the demo apps concurrently: they target independent repos and
+    # are dominated by network and subprocess latency, so wall-clock time is
+    # roughly the slowest app instead of the sum
+    with ThreadPoolExecutor(max_workers=len(demo_apps)) as executor:
+        futures = {}
+        for app_name, github_repo in demo_apps:
+            print(f">>> Publishing {app_name} demo app...")
+            futures[executor.submit(publish_demoapp, app_name, github_repo)] = app_name
         print()
 
+        for future in as_completed(futures):
+            app_name = futures[future]
+            with _print_lock:
+                if future.result():
+                    print(f"✅ {app_name} published successfully")
+                else:
+                    print(f"❌ {app_name} publish failed")
+                    failed_apps.append(app_name)
+    print()
+
     # Summary
     print("=== DEMO APP PUBLISH SUMMARY ===")
     if not failed_apps:
@@ -4,6 +4,7 @@ from unittest.mock import patch, MagicMock
 from semantic_release.commit_parser.conventional import ConventionalCommitParser
 from semantic_release.enums import LevelBump
 
+import io
 import sys
 from pathlib import Path
 
@@ -11,6 +12,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from generate_changelog import (
+    _iter_null_delimited,
+    _parse_record,
     extract_username_from_email,
     extract_username_from_coauthor,
     clean_commit_message,
@@ -28,74 +31,46 @@ from generate_changelog import (
 )
 
 
-class TestExtractUsernameFromEmail(unittest.TestCase):
-    def test_valid_email(self):
-        self.assertEqual(extract_username_from_email("john.doe@example.com"), "@john.doe")
-
-    def test_email_with_plus(self):
-        self.assertEqual(extract_username_from_email("john+test@example.com"), "@john+test")
-
-    def test_empty_email(self):
-        self.assertIsNone(extract_username_from_email(""))
-
-    def test_none_email(self):
-        self.assertIsNone(extract_username_from_email(None))
-
-    def test_noreply_email(self):
-        self.assertIsNone(extract_username_from_email("noreply@github.com"))
-
-    def test_no_reply_email(self):
-        self.assertIsNone(extract_username_from_email("no-reply@github.com"))
+# (input email, expected username or None)
+EMAIL_CASES = [
+    ("john.doe@example.com", "@john.doe"),
+    ("john+test@example.com", "@john+test"),
+    ("john-doe@example.com", "@john-doe"),
+    ("john_doe@example.com", "@john_doe"),
+    ("", None),
+    (None, None),
+    ("noreply@github.com", None),
+    ("no-reply@github.com", None),
+    ("github-actions@github.com", None),
+    ("viaductbot@airbnb.com", None),
+    ("notanemail", None),
+]
+
+# (input co-author line, expected username or None)
+COAUTHOR_CASES = [
+    ("John Doe <john.doe@example.com>", "@john.doe"),
+    ("Jane Smith <jane.smith@company.com>", "@jane.smith"),
+    ("<alice@example.com>", "@alice"),
+    ("Bob <bob+test@example.com>", "@bob+test"),
+    ("GitHub <noreply@github.com>", None),
+    ("Actions Bot <github-actions@github.com>", None),
+    ("Viaduct Bot <viaductbot@airbnb.com>", None),
+    ("John Doe", None),
+]
 
-    def test_github_actions_email(self):
-        self.assertIsNone(extract_username_from_email("github-actions@github.com"))
 
-    def test_viaductbot_email(self):
-        self.assertIsNone(extract_username_from_email("viaductbot@airbnb.com"))
-
-    def test_invalid_email_no_at(self):
-        self.assertIsNone(extract_username_from_email("notanemail"))
-
-    def test_email_with_dash(self):
-        self.assertEqual(extract_username_from_email("john-doe@example.com"), "@john-doe")
-
-    def test_email_with_underscore(self):
-        self.assertEqual(extract_username_from_email("john_doe@example.com"), "@john_doe")
+class TestExtractUsernameFromEmail(unittest.TestCase):
+    def test_cases(self):
+        for email, expected in EMAIL_CASES:
+            with self.subTest(email=email):
+                self.assertEqual(extract_username_from_email(email), expected)
 
 
 class TestExtractUsernameFromCoauthor(unittest.TestCase):
-    def test_valid_co_author_line(self):
-        self.assertEqual(
-            extract_username_from_coauthor("John Doe <john.doe@example.com>"),
-            "@john.doe"
-        )
-
-    def test_co_author_with_full_name(self):
-        self.assertEqual(
-            extract_username_from_coauthor("Jane Smith <jane.smith@company.com>"),
-            "@jane.smith"
-        )
-
-    def test_noreply_co_author(self):
-        self.assertIsNone(extract_username_from_coauthor("GitHub <noreply@github.com>"))
-
-    def test_github_actions_co_author(self):
-        self.assertIsNone(extract_username_from_coauthor("Actions Bot <github-actions@github.com>"))
-
-    def test_viaductbot_co_author(self):
-        self.assertIsNone(extract_username_from_coauthor("Viaduct Bot <viaductbot@airbnb.com>"))
-
-    def test_invalid_format_no_email(self):
-        self.assertIsNone(extract_username_from_coauthor("John Doe"))
-
-    def test_email_only(self):
-        self.assertEqual(extract_username_from_coauthor("<alice@example.com>"), "@alice")
-
-    def test_co_author_with_plus_in_email(self):
-        self.assertEqual(
-            extract_username_from_coauthor("Bob <bob+test@example.com>"),
-            "@bob+test"
-        )
+    def test_cases(self):
+        for line, expected in COAUTHOR_CASES:
+            with self.subTest(line=line):
+                self.assertEqual(extract_username_from_coauthor(line), expected)
 
 
 class TestCleanCommitMessage(unittest.TestCase):
@@ -162,24 +137,47 @@ class TestReplaceAirbnbMarker(unittest.TestCase):
         self.assertNotIn("123456", result)
 
 
-class TestShouldIncludeCommit(unittest.TestCase):
-    def test_includes_normal_commit(self):
-        self.assertTrue(should_include_commit("Fix bug in parser"))
-
-    def test_includes_feat_commit(self):
-        self.assertTrue(should_include_commit("feat: add new feature"))
+# (commit message, whether it belongs in the changelog)
+SHOULD_INCLUDE_CASES = [
+    ("Fix bug in parser", True),
+    ("feat: add new feature", True),
+    ("Fix: ignore whitespace in parser", True),
+    ("ignore: test commit", False),
+    ("IGNORE: experimental change", False),
+    ("Ignore: testing feature", False),
+]
 
-    def test_excludes_ignore_lowercase(self):
-        self.assertFalse(should_include_commit("ignore: test commit"))
 
-    def test_excludes_ignore_uppercase(self):
-        self.assertFalse(should_include_commit("IGNORE: experimental change"))
+class TestShouldIncludeCommit(unittest.TestCase):
+    def test_cases(self):
+        for message, expected in SHOULD_INCLUDE_CASES:
+            with self.subTest(message=message):
+                self.assertEqual(should_include_commit(message), expected)
+
+
+class TestRecordStreamParsing(unittest.TestCase):
+    def test_multi_record_stream(self):
+        # With --format=format: git emits a newline between records, so every
+        # record after the first starts with '\n' in its sha field
+        stream = io.BytesIO(
+            b"abc1234\x1ffix: bug one (AIRBNB)\x1f\x1fjohn@example.com\x1f\x00"
+            b"\ndef5678\x1ffeat: thing two\x1fbody text\x1fjane@example.com\x1f"
+            b"Bob <bob@example.com>\x00"
+            b"\nfed9876\x1fchore: last\x1f\x1falice@example.com\x1f"
+        )
+        commits = [_parse_record(r) for r in _iter_null_delimited(stream)]
+        self.assertEqual([c.sha for c in commits], ["abc1234", "def5678", "fed9876"])
+        self.assertEqual(commits[0].message, "fix: bug one (AIRBNB)")
+        self.assertEqual(commits[1].body, "body text")
+        self.assertEqual(commits[1].co_authors_raw, "Bob <bob@example.com>")
 
-    def test_excludes_ignore_mixed_case(self):
-        self.assertFalse(should_include_commit("Ignore: testing feature"))
+    def test_sha_not_corrupted_in_airbnb_substitution(self):
+        record = b"\nabc1234\x1ffix: bug (AIRBNB)\x1f\x1fjohn@example.com\x1f"
+        entry = parse_commit(_parse_record(record))
+        self.assertIn("(abc1234)", entry.message)
 
-    def test_includes_commit_with_ignore_in_middle(self):
-        self.assertTrue(should_include_commit("Fix: ignore whitespace in parser"))
+    def test_malformed_record_returns_none(self):
+        self.assertIsNone(_parse_record(b"not a record"))
 
 
 class TestExtractAuthors(unittest.TestCase):
@@ -211,7 +209,7 @@ class TestExtractAuthors(unittest.TestCase):
             message="Refactor code",
             body='',
             author_email="alice@example.com",
-            co_authors_raw="Bob <bob@example.com>|Charlie <charlie@example.com>"
+            co_authors_raw="Bob <bob@example.com>\x1eCharlie <charlie@example.com>"
         )
         authors = extract_authors(commit)
         self.assertEqual(authors, ["@alice", "@bob", "@charlie"])
@@ -255,7 +253,7 @@ class TestExtractAuthors(unittest.TestCase):
             message="Team effort",
             body='',
             author_email="lead@example.com",
-            co_authors_raw="Dev1 <dev1@example.com>|Bot <noreply@github.com>|Dev2 <dev2@example.com>"
+            co_authors_raw="Dev1 <dev1@example.com>\x1eBot <noreply@github.com>\x1eDev2 <dev2@example.com>"
         )
         authors = extract_authors(commit)
         self.assertEqual(authors, ["@lead", "@dev1", "@dev2"])
@@ -306,8 +304,11 @@ class TestChangelogEntry(unittest.TestCase):
 
 
 class TestParseCommit(unittest.TestCase):
-    def setUp(self):
-        self.parser = ConventionalCommitParser()
+    @classmethod
+    def setUpClass(cls):
+        # One parser for the whole TestCase; construction is not free and the
+        # parser is stateless between parse_message calls
+        cls.parser = ConventionalCommitParser()
 
     def test_conventional_commit_fix(self):
         commit = CommitInfo(
@@ -425,7 +426,9 @@ class TestRenderSection(unittest.TestCase):
             ChangelogEntry("a", "m1", ["@john"], "fix", None, "Fix bug 1", False, None, LevelBump.PATCH),
             ChangelogEntry("b", "m2", ["@jane"], "fix", None, "Fix bug 2", False, None, LevelBump.PATCH),
         ]
-        result = render_section("fix", entries)
+        out = []
+        render_section("fix", entries, out)
+        result = "\n".join(out)
         self.assertIn("## Bug Fixes", result)
         self.assertIn("- Fix bug 1 by @john", result)
         self.assertIn("- Fix bug 2 by @jane", result)
@@ -436,7 +439,9 @@ class TestRenderBreakingChanges(unittest.TestCase):
         entries = [
             ChangelogEntry("a", "m1", ["@john"], "fix", None, "d1", True, "Breaking change description", LevelBump.MAJOR),
         ]
-        result = render_breaking_changes(entries)
+        out = []
+        render_breaking_changes(entries, out)
+        result = "\n".join(out)
         self.assertIn("## Breaking Changes", result)
         self.assertIn("Breaking change description", result)
         self.assertIn("@john", result)
@@ -3,7 +3,8 @@ MkDocs Macros Plugin for Code Snippets
 Provides codetag and codefile macros similar to Hugo shortcodes.
 """
 
-import re
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 
@@ -34,10 +35,137 @@ LANG_MAP = {
 }
 
 
+# Resolved once at import: the docs directory and the repo root above it
+_DOCS_DIR = Path(__file__).resolve().parent.parent
+_REPO_ROOT = _DOCS_DIR.parent
+
+
+@lru_cache(maxsize=512)
+def _resolve(path):
+    """Resolve a macro path argument to an existing file, or None.
+
+    Candidates are tried from the repo root first, then the docs directory.
+    The result is cached because the same handful of paths is re-resolved
+    for every page that embeds them, and each miss costs two stat calls.
+    """
+    for base in (_REPO_ROOT, _DOCS_DIR):
+        candidate = base / path
+        if candidate.exists():
+            return candidate
+    return None
+
+
+@lru_cache(maxsize=128)
+def _read_text(resolved_path):
+    """Read and cache a source file's contents for the duration of a build.
+
+    Pages frequently embed several snippets from the same file; caching turns
+    every reference after the first into a dict hit instead of a disk read.
+    """
+    return Path(resolved_path).read_text(encoding='utf-8')
+
+
+def _to_kebab(name):
+    """Convert a CamelCase class name to a kebab-case URL slug.
+
+    e.g. NodeObject -> node-object. A simple character loop beats the
+    regex-substitute-then-lstrip approach for short class names.
+    """
+    out = []
+    for i, ch in enumerate(name):
+        if ch.isupper() and i > 0:
+            out.append('-')
+        out.append(ch.lower())
+    return ''.join(out)
+
+
+def _find_tag(content, tag):
+    """Locate a tag marker with plain substring search.
+
+    Tag format: # tag::TAG_NAME[LINES] or // tag::TAG_NAME[LINES],
+    optionally followed by a comment. The marker is a fixed literal, so a
+    single C-level find plus a bounded scan for the optional [LINES] suffix
+    replaces the regex engine entirely.
+
+    Returns:
+        (body_start, line_count) where body_start is the offset just past
+        the tag line and line_count is the tag's [LINES] value or None.
+        Returns None if the tag is not present.
+    """
+    needle = f'tag::{tag}'
+    idx = content.find(needle)
+    if idx < 0:
+        return None
+
+    after = idx + len(needle)
+    newline = content.find('\n', after)
+    if newline < 0:
+        newline = len(content)
+
+    line_count = None
+    if after < len(content) and content[after] == '[':
+        close = content.find(']', after + 1, newline)
+        if close > after + 1 and content[after + 1:close].isdigit():
+            line_count = int(content[after + 1:close])
+
+    return newline + 1, line_count
+
+
+@lru_cache(maxsize=None)
+def _lang_for_suffix(suffix):
+    """Look up the highlighting language for a lowercased file suffix."""
+    return LANG_MAP.get(suffix, 'text')
+
+
 def infer_language(path):
     """Infer the syntax highlighting language from a file path's extension."""
-    ext = Path(path).suffix.lower()
-    return LANG_MAP.get(ext, 'text')
+    # Plain string slicing avoids constructing a Path object per macro call
+    dot = path.rfind('.')
+    if dot <= path.rfind('/'):
+        return 'text'
+    return _lang_for_suffix(path[dot:].lower())
+
+
+@lru_cache(maxsize=256)
+def _render_codefile(path, start, end, lang):
+    """Render a codefile block, caching the finished markdown.
+
+    The github() macro delegates to codefile, so the same file is often
+    rendered more than once per build; caching the fenced output reuses it
+    verbatim instead of repeating the read, slice and format work.
+    """
+    full_path = _resolve(path)
+    if full_path is None:
+        raise FileNotFoundError(f"codefile: File not found: {path} (tried: {_REPO_ROOT / path})")
+
+    try:
+        if start is not None or end is not None:
+            # Stream just the requested range (1-indexed, end inclusive)
+            # instead of splitting the whole file into a line list
+            start_idx = (start - 1) if start else 0
+            with open(full_path, encoding='utf-8') as f:
+                lines = list(islice(f, start_idx, end))
+        else:
+            lines = _read_text(str(full_path)).splitlines(keepends=True)
+
+        content = ''.join(lines).rstrip()
+
+        line_range = ""
+        if start or end:
+            line_range = f" (lines {start or 1}-{end or len(lines)})"
+
+        return f"""
+```{lang}
+{content}
+```
+
+[View full file on GitHub](https://github.com/airbnb/viaduct/tree/master/{path}){line_range}
+"""
+
+    except FileNotFoundError:
+        raise
+    except Exception as e:
+        raise RuntimeError(f"codefile: Error reading file {path}: {str(e)}")
 
 
 def define_env(env):
@@ -64,44 +192,41 @@ def define_env(env):
         # Infer language from file extension if not specified
         if lang is None:
             lang = infer_language(path)
-        # Get the docs directory
-        docs_dir = Path(__file__).parent.parent
-
-        # Construct full path - first try from oss directory (one level up from docs)
-        full_path = docs_dir.parent / path
 
-        if not full_path.exists():
-            # Try from docs directory itself
-            full_path = docs_dir / path
-
-        if not full_path.exists():
-            raise FileNotFoundError(f"codetag: File not found: {path} (tried: {full_path})")
+        full_path = _resolve(path)
+        if full_path is None:
+            raise FileNotFoundError(f"codetag: File not found: {path} (tried: {_REPO_ROOT / path})")
 
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = _read_text(str(full_path))
 
             # Find the tag in the file
-            # Format: # tag::TAG_NAME[LINES] Optional comment
-            # or: // tag::TAG_NAME[LINES] Optional comment
-            tag_pattern = rf'(?:#|//)?\s*tag::{re.escape(tag)}(?:\[(\d+)\])?.*?\n'
-            match = re.search(tag_pattern, content)
+            found = _find_tag(content, tag)
 
-            if not match:
+            if found is None:
                 raise ValueError(f"codetag: Tag '{tag}' not found in {path}")
+            tag_end, tag_line_count = found
 
             # Get the number of lines to extract
             lines_to_extract = count
-            if lines_to_extract is None and match.group(1):
-                lines_to_extract = int(match.group(1))
+            if lines_to_extract is None and tag_line_count is not None:
+                lines_to_extract = tag_line_count
             if lines_to_extract is None:
                 lines_to_extract = 10  # Default
 
-            # Extract lines after the tag
-            tag_end = match.end()
-            remaining_content = content[tag_end:]
-            lines = remaining_content.split('\n')[:lines_to_extract]
-            snippet = '\n'.join(lines)
+            # Extract lines after the tag by scanning for the Nth newline;
+            # splitting the whole remainder would allocate a list of every
+            # line in the rest of the file just to keep the first few
+            snippet_end = tag_end
+            for _ in range(lines_to_extract):
+                newline = content.find('\n', snippet_end)
+                if newline < 0:
+                    snippet_end = len(content)
+                    break
+                snippet_end = newline + 1
+            # removesuffix drops only the final newline, preserving trailing
+            # blank lines inside the snippet
+            snippet = content[tag_end:snippet_end].removesuffix('\n')
 
             return f"""
 ```{lang}
@@ -134,47 +259,8 @@ def define_env(env):
         # Infer language from file extension if not specified
         if lang is None:
             lang = infer_language(path)
-        # Get the docs directory
-        docs_dir = Path(__file__).parent.parent
-
-        # Construct full path - first try from oss directory (one level up from docs)
-        full_path = docs_dir.parent / path
-
-        if not full_path.exists():
-            # Try from docs directory itself
-            full_path = docs_dir / path
-
-        if not full_path.exists():
-            raise FileNotFoundError(f"codefile: File not found: {path} (tried: {full_path})")
-
-        try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            # Extract line range if specified (convert to 0-indexed)
-            if start is not None or end is not None:
-                start_idx = (start - 1) if start else 0
-                end_idx = end if end else len(lines)
-                lines = lines[start_idx:end_idx]
-
-            content = ''.join(lines).rstrip()
-
-            line_range = ""
-            if start or end:
-                line_range = f" (lines {start or 1}-{end or len(lines)})"
-
-            return f"""
-```{lang}
-{content}
-```
 
-[View full file on GitHub](https://github.com/airbnb/viaduct/tree/master/{path}){line_range}
-"""
-
-        except FileNotFoundError:
-            raise
-        except Exception as e:
-            raise RuntimeError(f"codefile: Error reading file {path}: {str(e)}")
+        return _render_codefile(path, start, end, lang)
 
     @env.macro
     def github(file, maxHeight=500, branch="master"):
@@ -231,8 +317,7 @@ def define_env(env):
         package = ".".join(parts[:-1])
 
         # Convert class name to URL slug (CamelCase -> kebab-case)
-        # e.g., NodeObject -> -node-object -> node-object
-        class_slug = re.sub(r'([A-Z])', r'-\1', class_name).lower().lstrip('-')
+        class_slug = _to_kebab(class_name)
 
         # Build the documentation URL
         doc_url = f"/apis/{module}/{package}/{class_slug}/"